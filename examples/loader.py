@@ -1,7 +1,7 @@
 import os
 
 from cli_rack import CLI, ansi
-from cli_rack.loader import LoadedDataMeta, InvalidPackageStructure, LoaderRegistry, LoaderError
+from cli_rack.loader import LoadedDataMeta, InvalidPackageStructure, DefaultLoaderRegistry, LoaderError
 
 
 def packages_dir_resolver(meta: LoadedDataMeta) -> str:
@@ -15,23 +15,23 @@ def main():
     CLI.verbose_mode()
     CLI.print_info("Loading module using loader registry\n", ansi.Mod.BOLD)
 
-    LoaderRegistry.target_dir = "generated"
-
-    resource_meta = LoaderRegistry.load("github://corvis/esphome-packages", packages_dir_resolver)
-    CLI.print_info(resource_meta.to_dict())
+    DefaultLoaderRegistry.target_dir = "generated"
 
     base_dir = os.path.dirname(__file__)
     dir_asset_path = os.path.join(base_dir, "assets", "local-dir-asset")
-    resource_meta = LoaderRegistry.load("local:" + dir_asset_path)
-    CLI.print_info(resource_meta.to_dict())
+    loaded = DefaultLoaderRegistry.load_many(
+        [("github://corvis/esphome-packages", packages_dir_resolver), "local:" + dir_asset_path]
+    )
+    for resource_meta in loaded:
+        CLI.print_info(resource_meta.to_dict())
 
     try:
-        resource_meta = LoaderRegistry.load("something:blahblah")
+        resource_meta = DefaultLoaderRegistry.load("something:blahblah")
     except LoaderError as e:
         CLI.print_error(e)
 
     try:
-        resource_meta = LoaderRegistry.load("github://test/testrepo@1.1")
+        resource_meta = DefaultLoaderRegistry.load("github://test/testrepo@1.1")
     except LoaderError as e:
         CLI.print_error(e)
 
@@ -1,12 +1,21 @@
+from typing import Optional
+
 from cli_rack.modular import ExtensionUnavailableError
 
+_jinja2_available: Optional[bool] = None
+
 
 def is_available() -> bool:
-    try:
-        import jinja2
+    global _jinja2_available
+    if _jinja2_available is None:
+        try:
+            import jinja2  # noqa: F401
 
-        return True
-    except ImportError:
+            _jinja2_available = True
+        except ImportError:
+            _jinja2_available = False
+    if not _jinja2_available:
         raise ExtensionUnavailableError(
             "modular_app.feature2", "Jinja2 is required but it is not installed"
         ).hint_install_python_package("jinja2")
+    return True
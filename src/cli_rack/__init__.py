@@ -39,21 +39,31 @@ class __CLI:
         self.log_formatter: Optional[logging.Formatter] = None
         self.ui_formatter: Optional[logging.Formatter] = None
         self.__support_colors = False
+        self.__use_colors = False
+        self.__configured = False
 
     def setup(self, ui_log_level=logging.INFO, log_level=logging.INFO, show_stack_traces=False):
+        if self.__configured:
+            # Handlers and formatters are already in place, so only adjustable settings need to be updated
+            self.set_ui_log_level(ui_log_level)
+            self.set_log_level(log_level)
+            self.set_stack_traces(show_stack_traces)
+            return
         self.__support_colors = ansi.stream_supports_colors(sys.stderr) or ansi.stream_supports_colors(sys.stdin)
         self.log_formatter = CommonCliLogFormatter(
             use_colors=self.__support_colors, show_stack_traces=show_stack_traces
         )
         self.ui_formatter = UILogFormatter(use_colors=self.__support_colors, show_stack_traces=show_stack_traces)
+        self.__use_colors = self.__support_colors
         default_log_handler = logging.StreamHandler(sys.stderr)
         default_log_handler.formatter = self.log_formatter
         logging.basicConfig(level=log_level, handlers=[default_log_handler])
         ui_handler = logging.StreamHandler(sys.stderr)
         ui_handler.formatter = self.ui_formatter
-        self.ui_logger.level = ui_log_level
+        self.ui_logger.setLevel(ui_log_level)
         self.ui_logger.handlers = [ui_handler]
         self.ui_logger.propagate = False
+        self.__configured = True
 
     @property
     def support_colors(self) -> bool:
@@ -73,6 +83,7 @@ class __CLI:
             self.ui_formatter, CommonCliLogFormatter
         ):
             self.log_formatter.use_colors = self.ui_formatter.use_colors = val
+            self.__use_colors = val
 
     def verbose_mode(self):
         self.set_ui_log_level(logging.DEBUG)
@@ -90,10 +101,10 @@ class __CLI:
         self.set_stack_traces(True)
 
     def set_ui_log_level(self, value):
-        self.ui_logger.level = value
+        self.ui_logger.setLevel(value)
 
     def set_log_level(self, value):
-        logging.root.level = value
+        logging.root.setLevel(value)
 
     def set_stack_traces(self, value: bool):
         _attr_name = "show_stack_traces"
@@ -108,11 +119,15 @@ class __CLI:
         print(msg)
 
     def print_info(self, msg: str, style: Optional[ansi.AnsiCodeType] = None):
+        if not self.ui_logger.isEnabledFor(logging.INFO):
+            return
         if not isinstance(msg, str):
             msg = str(msg)
-        self.ui_logger.info(ansi.Seq.wrap(style, msg) if self.use_colors else msg)
+        self.ui_logger.info(ansi.Seq.wrap(style, msg) if style is not None and self.__use_colors else msg)
 
     def print_warn(self, msg: str):
+        if not self.ui_logger.isEnabledFor(logging.WARNING):
+            return
         if not isinstance(msg, str):
             msg = str(msg)
         self.ui_logger.warning(msg)
@@ -124,6 +139,8 @@ class __CLI:
         self.ui_logger.critical(exception_or_msg, exc_info=isinstance(exception_or_msg, Exception))
 
     def print_debug(self, msg: str):
+        if not self.ui_logger.isEnabledFor(logging.DEBUG):
+            return
         if not isinstance(msg, str):
             msg = str(msg)
         self.ui_logger.debug(msg)
@@ -30,55 +30,70 @@ See more details here: https://en.wikipedia.org/wiki/ANSI_escape_code
 """
 import os
 import platform
-import re
-from typing import Union, Tuple, Optional
-
-from .utils import any_of_keys_exists
+from typing import Union, Tuple, Optional, Dict, Hashable
 
 AnsiCodeType = Union[str, int, "AnsiCode", Tuple[int, ...], None]
 
-__COLOR_TERMS_RE = re.compile("^screen|^xterm|^vt100|^vt220|^rxvt|color|ansi|cygwin|linux", re.IGNORECASE)
+_COLOR_TERM_PREFIXES = ("screen", "xterm", "vt100", "vt220", "rxvt", "color", "ansi", "cygwin", "linux")
+_COLOR_ENV_KEYS = frozenset(("COLORTERM", "PYCHARM_HOSTED"))
+_CI_ENV_KEYS = frozenset(("TRAVIS", "CIRCLECI", "APPVEYOR", "GITLAB_CI", "GITHUB_ACTIONS", "BUILDKITE", "DRONE"))
+
+# cache rendered escape sequences for styles which are not AnsiCode instances (those keep their own), keyed by style
+_STYLE_CACHE: Dict[Hashable, str] = {}
+_STYLE_CACHE_MAX_SIZE = 256
 
 
 class AnsiCode(object):
+    __slots__ = ("_codes", "_params", "_csi")
+
     def __init__(self, code: AnsiCodeType) -> None:
-        self.__codes: Tuple[int, ...] = (0,)  # 0 - is Reset command
+        self._codes: Tuple[int, ...] = (0,)  # 0 - is Reset command
         if code is None:
-            return
-        if isinstance(code, tuple):
-            self.__codes = code
+            pass
+        elif isinstance(code, tuple):
+            self._codes = code
         elif isinstance(code, int):
-            self.__codes = (code,)
+            self._codes = (code,)
         elif isinstance(code, str):
-            self.__codes = (int(code),)
+            self._codes = (int(code),)
         elif isinstance(code, self.__class__):
-            self.__codes = code.codes
+            self._codes = code._codes
         else:
             raise ValueError(
                 "Invalid code passed to AnsiCode constructor. "
                 "Expected value is a number or a string representing number"
             )
+        # Codes are immutable so rendered representations could be computed once
+        self._params = ";".join(map(str, self._codes))
+        self._csi = "\033[" + self._params + "m"
 
     @property
     def codes(self) -> Tuple[int, ...]:
-        return self.__codes
+        return self._codes
 
     def __and__(self, other: AnsiCodeType):
         if other is None:
             raise ValueError("Operation is not supported for AnsiCode and None")
-        if isinstance(other, self.__class__):
-            return AnsiCode(self.codes + other.codes)
-        else:
-            return self.__and__(AnsiCode(other))
+        if isinstance(other, AnsiCode):
+            return AnsiCode(self._codes + other._codes)
+        elif isinstance(other, int):
+            return AnsiCode(self._codes + (other,))
+        elif isinstance(other, tuple):
+            return AnsiCode(self._codes + other)
+        elif isinstance(other, str):
+            return AnsiCode(self._codes + (int(other),))
+        raise ValueError(
+            "Invalid operand for AnsiCode. Expected value is AnsiCode, tuple, a number or a string representing number"
+        )
 
     def __add__(self, other):
         return self & other
 
     def __repr__(self):
-        return ";".join([repr(x) for x in self.codes])
+        return self._params
 
     def __str__(self):
-        return "AnsiCode<{}>".format(repr(self))
+        return "AnsiCode<" + self._params + ">"
 
 
 class Fg:
@@ -176,6 +191,8 @@ class Seq:
 
     @classmethod
     def __repr_ansii(cls, style: AnsiCodeType) -> str:
+        if isinstance(style, AnsiCode):
+            return style._params
         return style if isinstance(style, str) else repr(style)
 
     @classmethod
@@ -183,7 +200,13 @@ class Seq:
         if style is None:
             style = Fg.DEFAULT
         if msg is None:
-            style_str = cls.STYLE.format(params=cls.__repr_ansii(style))
+            if isinstance(style, AnsiCode):
+                return style._csi
+            style_str = _STYLE_CACHE.get(style)
+            if style_str is None:
+                if len(_STYLE_CACHE) >= _STYLE_CACHE_MAX_SIZE:
+                    _STYLE_CACHE.clear()
+                style_str = _STYLE_CACHE[style] = cls.STYLE.format(params=cls.__repr_ansii(style))
             return style_str
         else:
             return cls.wrap(style, msg)
@@ -191,12 +214,10 @@ class Seq:
     @classmethod
     def wrap(cls, style: Optional[AnsiCodeType], msg: str) -> str:
         style_str = cls.style(style)
-        result = []
-        for x in msg.split(cls.RESET):
-            result.append(style_str)
-            result.append(x)
-            result.append(Seq.RESET)
-        return "".join(result)
+        if cls.RESET not in msg:
+            return style_str + msg + cls.RESET
+        # Re-apply style after each nested reset so that the rest of the message stays styled
+        return style_str + msg.replace(cls.RESET, cls.RESET + style_str) + cls.RESET
 
     @classmethod
     def reset(cls):
@@ -293,19 +314,21 @@ class Seq:
 def stream_supports_colors(stream) -> bool:
     if os.environ.get("NOCOLOR"):
         return False
-    supports = stream.isatty() if "isatty" in dir(stream) else False
-    supports = supports or any_of_keys_exists(("COLORTERM", "PYCHARM_HOSTED"), os.environ.keys())
+    # isatty is checked on every call as the underlying file descriptor might be redirected at any moment
+    isatty = getattr(stream, "isatty", None)
+    supports = isatty() if isatty is not None else False
+    env_keys = os.environ.keys()
+    supports = supports or not env_keys.isdisjoint(_COLOR_ENV_KEYS)
     if not supports and "CI" in os.environ:
-        supports = any_of_keys_exists(
-            ("TRAVIS", "CIRCLECI", "APPVEYOR", "GITLAB_CI", "GITHUB_ACTIONS", "BUILDKITE", "DRONE"), os.environ.keys()
-        )
+        supports = not env_keys.isdisjoint(_CI_ENV_KEYS)
     if supports:
         return True
     term = os.environ.get("TERM")
     if term is not None:
-        if term.lower() == "dumb":
+        term = term.lower()
+        if term == "dumb":
             return False
-        if __COLOR_TERMS_RE.match(term):
+        if term.startswith(_COLOR_TERM_PREFIXES):
             return True
     try:
         if platform.system().lower() == "windows":
@@ -27,6 +27,9 @@ import logging
 from cli_rack import CLI
 from cli_rack.modular import GlobalArgsExtension
 
+_LOG_LEVEL_NAMES = ("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG")
+_LOG_LEVELS = {x: logging.getLevelName(x) for x in _LOG_LEVEL_NAMES}
+
 
 class VerboseModeCliExtension(GlobalArgsExtension):
     @classmethod
@@ -45,7 +48,7 @@ class VerboseModeCliExtension(GlobalArgsExtension):
             "--log-level",
             dest="log_level",
             action="store",
-            choices=("CRITICAL", "ERROR", "WARNING", "INFO", "DEBUG"),
+            choices=_LOG_LEVEL_NAMES,
             required=False,
             help="Configure verbosity level for application logger",
             # default=logging.getLevelName(logging.INFO),
@@ -53,10 +56,10 @@ class VerboseModeCliExtension(GlobalArgsExtension):
 
     def handle(self, args: argparse.Namespace):
         if args.verbose and args.log_level is None:
-            CLI.set_ui_log_level(logging.getLevelName("DEBUG"))
-            CLI.set_log_level(logging.getLevelName("DEBUG"))
+            CLI.set_ui_log_level(logging.DEBUG)
+            CLI.set_log_level(logging.DEBUG)
         elif args.log_level is not None:
-            CLI.set_log_level(logging.getLevelName(args.log_level))
+            CLI.set_log_level(_LOG_LEVELS[args.log_level])
             CLI.set_ui_log_level(logging.DEBUG if args.verbose else logging.INFO)
 
 
@@ -74,11 +77,10 @@ class DebugModeCliExtension(GlobalArgsExtension):
         )
 
     def handle(self, args: argparse.Namespace):
-        if args.debug:
+        debug = bool(args.debug)
+        if debug:
             CLI.set_log_level(logging.DEBUG)
-            CLI.set_stack_traces(True)
-        else:
-            CLI.set_stack_traces(False)
+        CLI.set_stack_traces(debug)
 
 
 class ShowUnavailableModulesCliExtension(GlobalArgsExtension):
@@ -21,24 +21,34 @@
 #    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
 #    SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from typing import Optional, Any
+from typing import Optional, Any, List
 
 
 class FixHintMixin:
     def __init__(self) -> None:
-        self.fix_hint: Optional[str] = None
+        self._hints: List[str] = []
+
+    @property
+    def fix_hint(self) -> Optional[str]:
+        # Initializer of the mixin might not be invoked (e.g. for exceptions) so buffer could be missing
+        hints = getattr(self, "_hints", None)
+        return "\n".join(hints) if hints else None
+
+    @fix_hint.setter
+    def fix_hint(self, val: Optional[str]):
+        self._hints = [val] if val is not None else []
 
     @staticmethod
     def supports_fix_hint(obj: Any) -> bool:
         if obj is None:
             return False
-        return hasattr(obj, "fix_hint")
+        return isinstance(obj, FixHintMixin) or hasattr(obj, "fix_hint")
 
     def add_hint(self, msg: str):
-        if self.fix_hint is not None:
-            self.fix_hint += "\n" + msg
-        else:
-            self.fix_hint = msg
+        try:
+            self._hints.append(msg)
+        except AttributeError:
+            self._hints = [msg]
 
     def hint_install_python_package(self, *packages: str):
         self.add_hint('Try to install package with "pip install {}"'.format(" ".join(packages)))
@@ -21,45 +21,96 @@
 #    TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
 #    SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
+import importlib.util
 import subprocess
 import sys
+from typing import Dict, Any, Optional
 
 try:
-    import pip  # noqa: F401
+    from importlib.metadata import distribution, PackageNotFoundError
+except ImportError:  # Python < 3.8
+    distribution = None  # type: ignore
 
-    pip_available = True
-except ImportError:
-    pip_available = False
+_PIP_COMMAND = [sys.executable, "-m", "pip"]
+_PIP_PIPE_SIZE = 1024 * 1024
+
+# cache package installation check results here
+_installed_packages_cache: Dict[str, bool] = {}
+_pip_available: Optional[bool] = None
+
+
+def is_pip_available() -> bool:
+    global _pip_available
+    if _pip_available is None:
+        # find_spec locates the package without executing it, importing pip is expensive
+        _pip_available = importlib.util.find_spec("pip") is not None
+    return _pip_available
 
 
 def verify_pip():
-    if not pip_available:
+    if not is_pip_available():
         raise ValueError(
             "PIP is not available so automatic installation is not supported. "
             "In order to fix this either install PIP or avoid automatic dependencies installation"
         )
 
 
-def _run_pip(*args, hide_output=True):
-    stdout = sys.stdout
-    stderr = sys.stderr
-    if hide_output:
+def _run_pip(*args, hide_output=True, capture_output=False):
+    # By default pip writes directly into file descriptors inherited from the current process
+    stdout: Optional[int] = None
+    stderr: Optional[int] = None
+    kwargs: Dict[str, Any] = {}
+    if capture_output:
         stdout = stderr = subprocess.PIPE
+        if sys.version_info >= (3, 10):
+            kwargs["pipesize"] = _PIP_PIPE_SIZE
+    elif hide_output:
+        stdout = stderr = subprocess.DEVNULL
     return subprocess.run(
-        ["pip"] + args, bufsize=1024, universal_newlines=True, stdout=stdout, stderr=stderr, shell=False
+        _PIP_COMMAND + list(args),
+        bufsize=-1,
+        universal_newlines=True,
+        stdout=stdout,
+        stderr=stderr,
+        shell=False,
+        **kwargs,
     )
 
 
-def is_package_installed(package_name: str):
+def clear_package_cache():
+    _installed_packages_cache.clear()
+
+
+def _read_package_installed(package_name: str) -> bool:
+    if distribution is not None:
+        try:
+            distribution(package_name)
+            return True
+        except PackageNotFoundError:
+            return False
     verify_pip()
     result = _run_pip("show", package_name)
-    if result.returncode != 0:
-        return False
-    else:
-        return True  # TODO: Verify version vere?
+    return result.returncode == 0  # TODO: Verify version vere?
 
 
-def install_package(package_name: str):
+def is_package_installed(package_name: str):
+    # Package which is already imported is obviously installed
+    if package_name.replace("-", "_") in sys.modules:
+        return True
+    installed = _installed_packages_cache.get(package_name)
+    if installed is None:
+        installed = _installed_packages_cache[package_name] = _read_package_installed(package_name)
+    return installed
+
+
+def install_packages(*package_names: str):
     verify_pip()
-    result = _run_pip("install", package_name, hide_output=False)
+    result = _run_pip("install", "--disable-pip-version-check", "--no-input", *package_names, hide_output=False)
+    if result.returncode == 0:
+        for x in package_names:
+            _installed_packages_cache[x] = True
     return result.returncode != 0
+
+
+def install_package(package_name: str):
+    return install_packages(package_name)
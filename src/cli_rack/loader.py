@@ -22,6 +22,7 @@
 #    SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import datetime
+import functools
 import hashlib
 import inspect
 import json
@@ -29,14 +30,70 @@ import logging
 import os
 import re
 import shutil
+import stat
+import threading
+import urllib.error
 import urllib.request
 from abc import abstractmethod, ABCMeta
-from typing import Optional, Union, Callable, List, Type, Tuple, Sequence
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Optional, Union, Callable, List, Type, Tuple, Sequence, Dict, Pattern
 from zipfile import ZipFile
 
 from cli_rack import utils
 from cli_rack.exception import CLIRackError
-from cli_rack.serialize import DateTimeEncoder, DateTimeDecoder
+from cli_rack.serialize import DateTimeEncoder, DateTimeDecoder, encode_datetime
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def _copy_and_hash(src, dst, chunk_size: int) -> str:
+    """
+    Copies content of file-like object src into dst computing SHA-256 of the data on the fly
+    :return: hex digest of the copied data
+    """
+    digest = hashlib.sha256()
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        digest.update(chunk)
+        dst.write(chunk)
+    return digest.hexdigest()
+
+
+def _link_file(src: str, dst: str):
+    if os.path.lexists(dst):
+        os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:  # Different file systems or links are not supported
+        shutil.copy2(src, dst)
+
+
+def _link_tree(src: str, dst: str):
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as it:
+        for entry in it:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir():
+                _link_tree(entry.path, target)
+            else:
+                _link_file(entry.path, target)
+
+
+@functools.lru_cache(maxsize=1024)
+def _hash_suffix(value: str) -> str:
+    return hashlib.sha1(value.encode()).hexdigest()[:8]
+
+
+@functools.lru_cache(maxsize=256)
+def _match_locator(locator_re: Pattern, locator_str: str) -> Optional[Tuple[Optional[str], ...]]:
+    match = locator_re.match(locator_str)
+    return match.groups() if match is not None else None
 
 
 class LoaderError(CLIRackError):
@@ -71,6 +128,7 @@ class InvalidPackageStructure(LoaderError):
 
 
 class BaseLocatorDef(metaclass=ABCMeta):
+    __slots__ = ("name", "original_locator")
     PATH_SEPARATOR = "/"
     PREFIX: str
     TYPE: str
@@ -81,7 +139,7 @@ class BaseLocatorDef(metaclass=ABCMeta):
 
     @classmethod
     def generate_hash_suffix(cls, suffix: str) -> str:
-        return hashlib.sha1(suffix.encode()).hexdigest()[:8]
+        return _hash_suffix(suffix)
 
     def to_dict(self) -> dict:
         return dict(type=self.TYPE, original_locator=self.original_locator)
@@ -103,12 +161,19 @@ class BaseLocatorDef(metaclass=ABCMeta):
 
 
 class LoadedDataMeta(object):
+    __slots__ = ("locator", "path", "target_path", "is_file", "timestamp", "checksum", "etag")
+
     def __init__(self, locator: BaseLocatorDef, path: str, target_path: Optional[str] = None) -> None:
         self.locator = locator
         self.path = path
         self.target_path = target_path
         self.is_file: Optional[bool] = None
-        self.timestamp: Optional[datetime.datetime] = datetime.datetime.now()
+        # Assigned when meta is written unless set explicitly
+        self.timestamp: Optional[datetime.datetime] = None
+        # Digest of the downloaded source if loader provides one
+        self.checksum: Optional[str] = None
+        # HTTP entity tag of the downloaded source if loader provides one
+        self.etag: Optional[str] = None
 
     @property
     def resolved_path(self) -> str:
@@ -120,6 +185,8 @@ class LoadedDataMeta(object):
             locator=self.locator.to_dict() if self.locator else None,
             target_path=self.target_path,
             is_file=self.is_file,
+            checksum=self.checksum,
+            etag=self.etag,
         )
 
     @classmethod
@@ -134,14 +201,29 @@ class LoadedDataMeta(object):
         meta = LoadedDataMeta(locator, path, meta_dict["target_path"])
         meta.timestamp = meta_dict["timestamp"]
         meta.is_file = meta_dict["is_file"]
+        meta.checksum = meta_dict.get("checksum")
+        meta.etag = meta_dict.get("etag")
         return meta
 
 
 class BaseLoader(object, metaclass=ABCMeta):
     LOCATOR_PREFIX_DELIMITER = ":"
     META_FILE_NAME = "meta.json"
+    META_CACHE_MAX_SIZE = 256
     LOCATOR_CLS: Type[BaseLocatorDef]
 
+    # Decoded meta files shared by all loaders, keyed by file path. Value is (mtime_ns, size, meta_dict)
+    _meta_cache: "OrderedDict[str, Tuple[int, int, dict]]" = OrderedDict()
+    _meta_cache_lock = threading.Lock()
+
+    # Locator prefix including delimiter, resolved once per loader class
+    _FULL_PREFIX: str
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "LOCATOR_CLS"):
+            cls._FULL_PREFIX = cls.LOCATOR_CLS.PREFIX + cls.LOCATOR_PREFIX_DELIMITER
+
     def __init__(self, logger: logging.Logger, target_dir="tmp/external") -> None:
         self.target_dir = target_dir
         self._logger = logger
@@ -149,12 +231,15 @@ class BaseLoader(object, metaclass=ABCMeta):
 
     @classmethod
     def _remove_locator_prefix(cls, data: str):
-        return data.replace(cls.LOCATOR_CLS.PREFIX + cls.LOCATOR_PREFIX_DELIMITER, "", 1)
+        # Equivalent of str.removeprefix which is not available in python 3.7
+        if data.startswith(cls._FULL_PREFIX):
+            return data[len(cls._FULL_PREFIX) :]
+        return data
 
     @classmethod
     def can_handle(cls, locator: Union[str, BaseLocatorDef]) -> bool:
         if isinstance(locator, str):
-            return locator.startswith(cls.LOCATOR_CLS.PREFIX + cls.LOCATOR_PREFIX_DELIMITER)
+            return locator.startswith(cls._FULL_PREFIX)
         elif isinstance(locator, BaseLocatorDef):
             return cls.LOCATOR_CLS == locator.__class__
         else:
@@ -178,27 +263,67 @@ class BaseLoader(object, metaclass=ABCMeta):
     ) -> LoadedDataMeta:
         raise NotImplementedError
 
+    @staticmethod
+    def _encode_meta(meta: LoadedDataMeta) -> bytes:
+        if orjson is not None:
+            # Passthrough keeps datetime format compatible with DateTimeDecoder
+            return orjson.dumps(meta.to_dict(), default=encode_datetime, option=orjson.OPT_PASSTHROUGH_DATETIME)
+        return json.dumps(meta.to_dict(), cls=DateTimeEncoder).encode("utf-8")
+
     def write_meta(self, meta: LoadedDataMeta):
-        with open(os.path.join(meta.path, self.META_FILE_NAME), "w") as f:
-            json.dump(meta.to_dict(), f, cls=DateTimeEncoder)
+        if meta.timestamp is None:
+            meta.timestamp = datetime.datetime.now()
+        meta_path = os.path.join(meta.path, self.META_FILE_NAME)
+        data = self._encode_meta(meta)
+        with BaseLoader._meta_cache_lock:
+            BaseLoader._meta_cache.pop(meta_path, None)
+        # Write to temporary file first so readers never see partially written meta
+        tmp_path = meta_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, meta_path)
+
+    @classmethod
+    def _read_meta_dict(cls, meta_path: str) -> dict:
+        st = os.stat(meta_path)
+        cache = BaseLoader._meta_cache
+        with BaseLoader._meta_cache_lock:
+            cached = cache.get(meta_path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                cache.move_to_end(meta_path)
+                return cached[2]
+        if orjson is not None:
+            with open(meta_path, "rb") as f:
+                meta_dict = orjson.loads(f.read())
+            # orjson has no object hook, the only encoded value in meta is timestamp
+            if isinstance(meta_dict.get("timestamp"), dict):
+                meta_dict["timestamp"] = DateTimeDecoder.dict_to_object(meta_dict["timestamp"])
+        else:
+            with open(meta_path, "r") as f:
+                meta_dict = json.load(f, cls=DateTimeDecoder)
+        with BaseLoader._meta_cache_lock:
+            cache[meta_path] = (st.st_mtime_ns, st.st_size, meta_dict)
+            if len(cache) > cls.META_CACHE_MAX_SIZE:
+                cache.popitem(last=False)
+        return meta_dict
 
     def read_meta(self, package_path: str):
         try:
-            with open(os.path.join(package_path, self.META_FILE_NAME), "r") as f:
-                meta_dict = json.load(f, cls=DateTimeDecoder)
-                return LoadedDataMeta.from_dict(meta_dict, package_path)
+            meta_dict = self._read_meta_dict(os.path.join(package_path, self.META_FILE_NAME))
+            return LoadedDataMeta.from_dict(meta_dict, package_path)
         except Exception as e:
             raise LoaderError("Package {} metadata is missing or corrupted".format(package_path)) from e
 
     def verify_existing_package(self, local_path: str) -> Optional[LoadedDataMeta]:
-        if os.path.isdir(local_path):
-            try:
-                meta = self.read_meta(local_path)
-            except LoaderError:
-                self._logger.debug("Package exists, but it is corrupted. Removing.")
-                shutil.rmtree(local_path)
+        try:
+            meta_dict = self._read_meta_dict(os.path.join(local_path, self.META_FILE_NAME))
+            return LoadedDataMeta.from_dict(meta_dict, local_path)  # Package exists and it is ok
+        except Exception:
+            # Meta file is missing or unreadable, directory is checked to distinguish missing and corrupted package
+            if not os.path.isdir(local_path):
                 return None
-            return meta  # Package exists and it is ok
+        self._logger.debug("Package exists, but it is corrupted. Removing.")
+        shutil.rmtree(local_path)
         return None
 
     def is_reload_required(self, meta: Optional[LoadedDataMeta]) -> bool:
@@ -221,7 +346,18 @@ class BaseLoader(object, metaclass=ABCMeta):
             meta.target_path = ""
         return meta
 
-    def _check_if_should_load(self, path: str, force_reload: bool) -> Tuple[Optional[LoadedDataMeta], bool]:
+    def _check_if_should_load(
+        self, path: str, force_reload: bool, keep_outdated=False
+    ) -> Tuple[Optional[LoadedDataMeta], bool]:
+        """
+        Checks if package located at the given path must be (re)loaded. Existing package is removed when it has to be
+        reloaded.
+
+        :param path: package path
+        :param force_reload: reload even if existing package is up to date
+        :param keep_outdated: do not remove the package when it is outdated, caller will take care of it
+        :return: meta of the existing package (if any) and reload flag
+        """
         meta = self.verify_existing_package(path)
         if meta is not None:
             self._logger.info("Existing package found")
@@ -233,8 +369,9 @@ class BaseLoader(object, metaclass=ABCMeta):
                 is_reload_required = self.is_reload_required(meta)
                 if is_reload_required:
                     self._logger.info("Package is outdated and will be reloaded")
-                    shutil.rmtree(path)
-                return meta, self.is_reload_required(meta)
+                    if not keep_outdated:
+                        shutil.rmtree(path)
+                return meta, is_reload_required
         return None, True
 
     def _write_meta(self, meta: LoadedDataMeta) -> LoadedDataMeta:
@@ -248,7 +385,11 @@ class LoaderRegistry(object):
     def __init__(self) -> None:
         super().__init__()
         self.__registry: List[BaseLoader] = []
+        self.__by_type: Dict[str, BaseLoader] = {}
+        self.__by_prefix: Dict[str, BaseLoader] = {}
+        self.__by_locator_cls: Dict[Type[BaseLocatorDef], BaseLoader] = {}
         self.__target_dir: Optional[str] = None
+        self.__lock = threading.RLock()
 
     @property
     def target_dir(self) -> Optional[str]:
@@ -256,9 +397,10 @@ class LoaderRegistry(object):
 
     @target_dir.setter
     def target_dir(self, val: str):
-        self.__target_dir = val
-        for x in self.__registry:
-            x.target_dir = self.__target_dir
+        with self.__lock:
+            self.__target_dir = val
+            for x in self.__registry:
+                x.target_dir = self.__target_dir
 
     def __instantinate_loader(self, loader_cls: Type[BaseLoader]) -> BaseLoader:
         try:
@@ -270,13 +412,22 @@ class LoaderRegistry(object):
                 "kwargs: target_dir".format(loader_cls.__name__)
             ) from e
 
+    def __add_loader(self, loader: BaseLoader) -> None:
+        with self.__lock:
+            self.__registry.append(loader)
+            # The first registered loader wins, the same way as for sequential lookup
+            self.__by_type.setdefault(loader.LOCATOR_CLS.TYPE, loader)
+            self.__by_prefix.setdefault(loader.LOCATOR_CLS.PREFIX, loader)
+            self.__by_locator_cls.setdefault(loader.LOCATOR_CLS, loader)
+
     def register(self, loader: Union[Type[BaseLoader], BaseLoader]) -> BaseLoader:
         if inspect.isclass(loader) and issubclass(loader, BaseLoader):  # type: ignore
-            instance = self.__instantinate_loader(loader)  # type: ignore
-            self.__registry.append(instance)
+            with self.__lock:
+                instance = self.__instantinate_loader(loader)  # type: ignore
+                self.__add_loader(instance)
             return instance
         elif isinstance(loader, BaseLoader):
-            self.__registry.append(loader)
+            self.__add_loader(loader)
             return loader
         else:
             raise ValueError("LoadRegistry expects subclass of BaseLoader but {} was given".format(loader.__name__))
@@ -305,6 +456,13 @@ class LoaderRegistry(object):
         return loader.locator_to_locator_def(locator)
 
     def get_for_locator(self, locator: Union[str, BaseLocatorDef]) -> Optional[BaseLoader]:
+        if isinstance(locator, str):
+            candidate = self.__by_prefix.get(locator.split(BaseLoader.LOCATOR_PREFIX_DELIMITER, 1)[0])
+        else:
+            candidate = self.__by_locator_cls.get(locator.__class__)
+        if candidate is not None and candidate.can_handle(locator):
+            return candidate
+        # Loaders might override can_handle so fallback to sequential lookup
         for x in self.__registry:
             if x.can_handle(locator):
                 return x
@@ -314,10 +472,7 @@ class LoaderRegistry(object):
         target_type = locator_dict.get("type")
         if target_type is None:
             return None
-        for x in self.__registry:
-            if x.LOCATOR_CLS.TYPE == target_type:
-                return x
-        return None
+        return self.__by_type.get(target_type)
 
     def load(
         self,
@@ -330,6 +485,41 @@ class LoaderRegistry(object):
             raise LoaderError("Locator {} is not supported".format(str(locator)))
         return loader.load(locator, target_path_resolver=target_path_resolver, force_reload=force_reload)
 
+    def load_many(
+        self,
+        locators: Sequence[
+            Union[
+                str,
+                BaseLocatorDef,
+                Tuple[Union[str, BaseLocatorDef], Optional[Callable[[LoadedDataMeta], str]]],
+            ]
+        ],
+        target_path_resolver: Optional[Callable[[LoadedDataMeta], str]] = None,
+        force_reload=False,
+        max_workers: Optional[int] = 8,
+    ) -> List[LoadedDataMeta]:
+        """
+        Loads multiple resources concurrently. Loading is I/O bound (downloads, file copying) so
+        resources are processed in a thread pool.
+        :param locators: sequence of locators or (locator, target_path_resolver) tuples
+        :param target_path_resolver: resolver used for locators given without their own resolver
+        :param force_reload: if set, existing local copies will be reloaded
+        :param max_workers: maximum number of resources loaded at the same time
+        :return: list of metadata objects in the same order as given locators
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Duplicates are loaded once, otherwise concurrent loads would write into the same target dir
+            submitted: Dict[tuple, Future] = {}
+            futures: List[Future] = []
+            for x in locators:
+                locator, resolver = x if isinstance(x, tuple) else (x, target_path_resolver)
+                key = (locator if isinstance(locator, str) else id(locator), resolver)
+                future = submitted.get(key)
+                if future is None:
+                    future = submitted[key] = executor.submit(self.load, locator, resolver, force_reload)
+                futures.append(future)
+            return [f.result() for f in futures]
+
     def clone(self) -> "LoaderRegistry":
         res = LoaderRegistry()
         res.register_all(self.__registry)
@@ -344,6 +534,7 @@ DefaultLoaderRegistry = LoaderRegistry()
 
 
 class LocalLocatorDef(BaseLocatorDef):
+    __slots__ = ("path",)
     PREFIX = "local"
     TYPE = "local"
 
@@ -365,12 +556,17 @@ class LocalLocatorDef(BaseLocatorDef):
         return cls(locator_dict["path"], locator_dict.get("original_locator"))
 
 
-@DefaultLoaderRegistry.register
 class LocalLoader(BaseLoader):
     LOCATOR_CLS = LocalLocatorDef
+    COPY_MODE_COPY = "copy"
+    COPY_MODE_LINK = "link"
 
     def __init__(self, target_dir="tmp/external") -> None:
         super().__init__(logging.getLogger("loader.local"), target_dir)
+        # COPY_MODE_LINK creates hard links instead of copying file content (falls back to copying when source is
+        # on a different file system). Linked files share content with the source so loaded resources must not be
+        # modified in place.
+        self.copy_mode = self.COPY_MODE_COPY
 
     @classmethod
     def locator_to_locator_def(cls, locator_str: Union[str, BaseLocatorDef]) -> LocalLocatorDef:
@@ -388,10 +584,16 @@ class LocalLoader(BaseLoader):
                 )
             )
 
+    @classmethod
+    def resolve_stat(cls, path: str) -> os.stat_result:
+        try:
+            return os.stat(path)
+        except OSError as e:
+            raise CLIRackError('Invalid locator: path "{}" doesn\'t exist'.format(path)) from e
+
     @classmethod
     def resolve_path(cls, path: str) -> str:
-        if not os.path.exists(path):
-            raise CLIRackError('Invalid locator: path "{}" doesn\'t exist'.format(path))
+        cls.resolve_stat(path)
         return path
 
     def load(
@@ -403,7 +605,8 @@ class LocalLoader(BaseLoader):
         self._logger.info("Loading " + str(locator_))
         locator = self.locator_to_locator_def(locator_)
         fs_target = os.path.join(self.target_dir, locator.name)
-        fs_source = self.resolve_path(locator.path)
+        fs_source = locator.path
+        source_stat = self.resolve_stat(fs_source)
         meta, is_reload_required = self._check_if_should_load(fs_target, force_reload)
         if not is_reload_required:
             self._logger.info("Cached version is up do date")
@@ -412,13 +615,19 @@ class LocalLoader(BaseLoader):
         utils.ensure_dir(fs_target)
         self._logger.debug("\tTarget path: " + fs_target)
         self._logger.debug("\tSource path: " + fs_source)
-        if os.path.isfile(fs_source):
+        if stat.S_ISREG(source_stat.st_mode):
             file_name = os.path.basename(fs_source)
-            shutil.copy(fs_source, fs_target)
+            if self.copy_mode == self.COPY_MODE_LINK:
+                _link_file(fs_source, os.path.join(fs_target, file_name))
+            else:
+                shutil.copy(fs_source, fs_target)
             meta = LoadedDataMeta(locator, fs_target, file_name)
             meta.is_file = True
-        elif os.path.isdir(fs_source):
-            shutil.copytree(fs_source, fs_target, dirs_exist_ok=True)  # type: ignore
+        elif stat.S_ISDIR(source_stat.st_mode):
+            if self.copy_mode == self.COPY_MODE_LINK:
+                _link_tree(fs_source, fs_target)
+            else:
+                shutil.copytree(fs_source, fs_target, dirs_exist_ok=True)  # type: ignore
             meta = LoadedDataMeta(locator, fs_target)
             meta.is_file = False
             if target_path_resolver is not None:
@@ -439,6 +648,7 @@ DefaultLoaderRegistry.register(LocalLoader)
 
 
 class GitLocatorDef(BaseLocatorDef):
+    __slots__ = ("url", "ref")
     TYPE = "git"
     PREFIX = "git"
 
@@ -464,6 +674,7 @@ class GitLocatorDef(BaseLocatorDef):
 
 
 class GithubLocatorDef(GitLocatorDef):
+    __slots__ = ("user_name", "repo_name")
     PREFIX = "github"
     TYPE = "github"
 
@@ -502,10 +713,13 @@ class GithubLoader(BaseLoader):
     LOCATOR_RE = re.compile(
         LOCATOR_CLS.PREFIX
         + BaseLoader.LOCATOR_PREFIX_DELIMITER
-        + r"//?([a-zA-Z0-9\-]+)/([a-zA-Z0-9\-\._]+)(?:@([a-zA-Z0-9\-_.\./]+))?"
+        + r"//?([a-zA-Z0-9\-]+)/([a-zA-Z0-9\-\._]+)(?:@([a-zA-Z0-9\-_.\./]+))?",
+        re.ASCII,
     )
     GITHUB_ZIP_URL = "https://api.github.com/repos/{user}/{repo}/zipball/{ref}"
     LOCAL_ZIPBALL_NAME = "zipball.zip"
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+    USER_AGENT = "cli-rack"
 
     def __init__(self, target_dir="tmp/external") -> None:
         super().__init__(logging.getLogger("loader.github"), target_dir)
@@ -514,21 +728,20 @@ class GithubLoader(BaseLoader):
     @classmethod
     def locator_to_locator_def(cls, locator_str: Union[str, BaseLocatorDef]) -> GithubLocatorDef:
         if isinstance(locator_str, str):
-            match = cls.LOCATOR_RE.match(locator_str)
+            match = _match_locator(cls.LOCATOR_RE, locator_str)
             if match is None:
                 raise LoaderError(
                     'Invalid github locator "{}". '
                     "Supported format is {}".format(
                         locator_str,
-                        cls.LOCATOR_CLS.PREFIX
-                        + BaseLoader.LOCATOR_PREFIX_DELIMITER
-                        + "//username/name[@branch-or-tag]",
+                        cls._FULL_PREFIX + "//username/name[@branch-or-tag]",
                     )
                 )
+            user_name, repo_name, ref = match
             return GithubLocatorDef(
-                user_name=match.group(1),
-                repo_name=match.group(2),
-                ref=match.group(3),
+                user_name=utils.none_throws(user_name),
+                repo_name=utils.none_throws(repo_name),
+                ref=ref,
                 original_locator=locator_str,
             )
         elif isinstance(locator_str, GithubLocatorDef):
@@ -550,34 +763,85 @@ class GithubLoader(BaseLoader):
         locator = self.locator_to_locator_def(locator_)
         fs_target = os.path.join(self.target_dir, locator.name)
         source_url = self.GITHUB_ZIP_URL.format(user=locator.user_name, repo=locator.repo_name, ref=locator.ref or "")
-        # if target dir already exists - remove it
-        meta, is_reload_required = self._check_if_should_load(fs_target, force_reload)
+        # Outdated package is kept until the new archive is downloaded, if it didn't change there is no need to unpack
+        meta, is_reload_required = self._check_if_should_load(fs_target, force_reload, keep_outdated=True)
         if not is_reload_required:
             self._logger.info("Local copy exists and it is up to date")
             return utils.none_throws(meta)
-        utils.ensure_dir(fs_target)
+        existing_meta = meta if not force_reload else None
+        utils.ensure_dir(self.target_dir)
         self._logger.debug("\tTarget path: " + fs_target)
         self._logger.debug("\tSource path: " + source_url)
-        zipball_path = os.path.join(fs_target, self.LOCAL_ZIPBALL_NAME)
+        zipball_path = os.path.join(self.target_dir, locator.name + "-" + self.LOCAL_ZIPBALL_NAME)
+        downloaded = self._download(locator_, source_url, zipball_path, existing_meta)
+        if downloaded is None:
+            self._logger.info("Remote resource is not modified since the last download")
+            existing_meta = utils.none_throws(existing_meta)
+            existing_meta.timestamp = None
+            return self._write_meta(existing_meta)
+        etag, checksum = downloaded
+        if existing_meta is not None and existing_meta.checksum == checksum:
+            self._logger.info("Downloaded archive is identical to the local copy")
+            os.remove(zipball_path)
+            existing_meta.timestamp = None
+            existing_meta.etag = etag
+            return self._write_meta(existing_meta)
+        if existing_meta is not None:
+            shutil.rmtree(fs_target)
+        utils.ensure_dir(fs_target)
+        self._unpack(locator_, zipball_path, fs_target)
+        meta = self._prepare_meta(locator, fs_target, target_path_resolver)
+        meta.checksum = checksum
+        meta.etag = etag
+        return self._write_meta(meta)
+
+    def _download(
+        self,
+        locator_: Union[str, BaseLocatorDef],
+        source_url: str,
+        zipball_path: str,
+        existing_meta: Optional[LoadedDataMeta],
+    ) -> Optional[Tuple[Optional[str], str]]:
+        """
+        Downloads archive into ``zipball_path``. Returns etag and checksum of the archive or None if
+        ``existing_meta`` is provided and remote resource is not modified since it was downloaded
+        """
         try:
             self._logger.info("\tDownloading archive from github: " + source_url)
-            urllib.request.urlretrieve(source_url, zipball_path)
+            headers = {"User-Agent": self.USER_AGENT}
+            if existing_meta is not None and existing_meta.etag is not None:
+                headers["If-None-Match"] = existing_meta.etag
+            request = urllib.request.Request(source_url, headers=headers)
+            with urllib.request.urlopen(request) as response, open(zipball_path, "wb") as f:
+                etag = response.headers.get("ETag")
+                checksum = _copy_and_hash(response, f, self.DOWNLOAD_CHUNK_SIZE)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and existing_meta is not None:
+                return None
+            raise LoaderError("Unable to fetch remote resource {}:{}".format(str(locator_), str(e))) from e
         except IOError as e:
             raise LoaderError("Unable to fetch remote resource {}:{}".format(str(locator_), str(e))) from e
+        return etag, checksum
+
+    def _unpack(self, locator_: Union[str, BaseLocatorDef], zipball_path: str, fs_target: str):
+        """
+        Extracts content of the archive into ``fs_target`` and removes the archive
+        """
         try:
+            # CRC of every member is verified while it is being extracted
             with ZipFile(zipball_path, "r") as z:
-                dir_name = z.namelist()[0]
-                z.extractall(fs_target)
-            # Move all files from dir_name one level up
-            dir_path = os.path.join(fs_target, dir_name)
-            for file_name in os.listdir(dir_path):
-                shutil.move(os.path.join(dir_path, file_name), fs_target)
-            os.rmdir(dir_path)
+                members = z.infolist()
+                # Archive contains a single top level directory, its content is extracted directly into target dir
+                dir_name = members[0].filename
+                for member in members[1:]:
+                    if member.filename.startswith(dir_name):
+                        member.filename = member.filename[len(dir_name) :]
+                    if member.filename:
+                        z.extract(member, fs_target)
         except Exception as e:
             raise LoaderError("Unable to unpack the resource {}:{}".format(str(locator_), str(e))) from e
-        os.remove(zipball_path)
-        meta = self._prepare_meta(locator, fs_target, target_path_resolver)
-        return self._write_meta(meta)
+        finally:
+            os.remove(zipball_path)
 
     def _prepare_meta(
         self, locator: BaseLocatorDef, path: str, target_path_resolver: Optional[Callable[[LoadedDataMeta], str]] = None
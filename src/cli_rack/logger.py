@@ -26,6 +26,9 @@ from typing import Dict, Optional
 
 from .ansi import Seq, Fg, Mod, AnsiCodeType
 
+_RESET = Seq.reset()
+_DEFAULT_STYLE = Seq.style(Fg.DEFAULT)
+
 
 class CommonCliLogFormatter(logging.Formatter):
     DEFAULT_STACK_COLOR = Mod.NORMAL & Fg.YELLOW
@@ -55,14 +58,29 @@ class CommonCliLogFormatter(logging.Formatter):
         show_stack_traces=False,
     ):
         super().__init__()
+        self.__use_colors = False
         self.use_colors = use_colors
         self.logger2color: Dict[str, str] = {}
         self.level2color: Dict[int, str] = level2color or dict(self.DEFAULT_COLORS)
         self.level2name: Dict[int, str] = level2name or dict(self.DEFAULT_LEVEL_MAP)
         self.stack_color: str = stack_color or self.DEFAULT_STACK_COLOR
-        self.max_logger_name_len: Optional[int] = max_logger_name_len or self.DEFAULT_LOGGER_NAME_LEN
+        # Formatted logger names keyed by logger name
+        self.__logger_name_cache: Dict[str, str] = {}
+        self.__max_logger_name_len: Optional[int] = max_logger_name_len or self.DEFAULT_LOGGER_NAME_LEN
         self.show_stack_traces = show_stack_traces
 
+    @property
+    def use_colors(self) -> bool:
+        return self.__use_colors
+
+    @use_colors.setter
+    def use_colors(self, val: bool):
+        self.__use_colors = val
+        # Message formatting is specialized once instead of checking the flag for every record. Subclasses which
+        # override formatMessage keep their own implementation.
+        if type(self).formatMessage is CommonCliLogFormatter.formatMessage:
+            self.formatMessage = self._format_colored if val else self._format_plain  # type: ignore
+
     def get_color_for_record(self, record: logging.LogRecord):
         color = self.logger2color.get(record.name)
         if color is None:
@@ -70,31 +88,43 @@ class CommonCliLogFormatter(logging.Formatter):
         return color
 
     def _color_seq(self, color: Optional[AnsiCodeType]):
-        if color is None:
-            color = Fg.DEFAULT
-        return Seq.style(color) if self.use_colors else ""
+        if not self.use_colors:
+            return ""
+        return _DEFAULT_STYLE if color is None else Seq.style(color)
 
     def _color_reset(self):
-        return Seq.reset() if self.use_colors else ""
+        return _RESET if self.use_colors else ""
+
+    @property
+    def max_logger_name_len(self) -> Optional[int]:
+        return self.__max_logger_name_len
+
+    @max_logger_name_len.setter
+    def max_logger_name_len(self, val: Optional[int]):
+        self.__max_logger_name_len = val
+        self.__logger_name_cache.clear()
 
     def format_logger_name(self, name: str) -> str:
-        if self.max_logger_name_len is None:
-            return name
+        cached = self.__logger_name_cache.get(name)
+        if cached is not None:
+            return cached
         logger_name_formatted: str = name
-        if len(logger_name_formatted) > self.max_logger_name_len:
-            logger_name_formatted = logger_name_formatted[: self.max_logger_name_len]
-        return logger_name_formatted.ljust(self.max_logger_name_len, " ")
+        if self.__max_logger_name_len is not None:
+            if len(logger_name_formatted) > self.__max_logger_name_len:
+                logger_name_formatted = logger_name_formatted[: self.__max_logger_name_len]
+            logger_name_formatted = logger_name_formatted.ljust(self.__max_logger_name_len, " ")
+        self.__logger_name_cache[name] = logger_name_formatted
+        return logger_name_formatted
 
-    def formatMessage(self, record: logging.LogRecord):
+    def _format_plain(self, record: logging.LogRecord) -> str:
         logger_name_formatted = self.format_logger_name(record.name)
-        color = self.get_color_for_record(record)
-        components = [
-            "[" + self.level2name.get(record.levelno, " ") + "]",
-            "[" + logger_name_formatted + "] ",
-            record.message,
-        ]
-        result = "".join(components)
-        return Seq.wrap(color, result) if self.use_colors else result
+        return f"[{self.level2name.get(record.levelno, ' ')}][{logger_name_formatted}] {record.message}"
+
+    def _format_colored(self, record: logging.LogRecord) -> str:
+        return Seq.wrap(self.get_color_for_record(record), self._format_plain(record))
+
+    def formatMessage(self, record: logging.LogRecord):
+        return self._format_colored(record) if self.__use_colors else self._format_plain(record)
 
     def formatException(self, ei):
         components = [self._color_seq(self.level2color.get(logging.ERROR))]
@@ -114,12 +144,9 @@ class UILogFormatter(CommonCliLogFormatter):
         logging.CRITICAL: Mod.BOLD & Fg.RED,
     }
 
-    def formatMessage(self, record: logging.LogRecord):
-        color = self.get_color_for_record(record)
-        prefix = ""
+    def _format_plain(self, record: logging.LogRecord) -> str:
         if record.levelno == logging.ERROR:
-            prefix = "ERROR: "
+            return "ERROR: " + record.message
         elif record.levelno == logging.FATAL:
-            prefix = "FATAL ERROR: "
-        result = prefix + record.message
-        return Seq.wrap(color, result) if self.use_colors else result
+            return "FATAL ERROR: " + record.message
+        return record.message
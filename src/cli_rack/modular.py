@@ -23,16 +23,16 @@
 
 import argparse
 import importlib
-import inspect
 import logging
+import os
 import pkgutil
+import sys
 from abc import ABC, abstractmethod
 from asyncio import AbstractEventLoop
-from typing import Optional, Sequence, List, Union, Iterable, NamedTuple, Type
+from typing import Optional, Sequence, List, Union, Iterable, NamedTuple, Type, Dict, Tuple, Callable, Set
 
 from cli_rack import CLI
 from cli_rack.exception import CLIRackError
-from cli_rack.utils import scalar_to_list
 
 
 class CliExtension(ABC):
@@ -43,6 +43,13 @@ class CliExtension(ABC):
     COMMAND_NAME: Optional[str] = None
     COMMAND_DESCRIPTION: Optional[str] = None
 
+    # Representation of extension instances, resolved once per class
+    _repr_str = "<CliExtension>"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._repr_str = "<{}>".format(cls.__qualname__)
+
     def __init__(self, *args, **kwargs):
         super().__init__()
 
@@ -58,7 +65,7 @@ class CliExtension(ABC):
         raise NotImplementedError()
 
     def __repr__(self) -> str:
-        return "<{}>".format(self.__class__.__qualname__)
+        return self._repr_str
 
 
 class AsyncCliExtension(CliExtension):
@@ -93,12 +100,59 @@ class Availability(NamedTuple):
     recommendation: Optional[str]
 
 
+# Availability without details is immutable so the same instances are shared
+_AVAILABLE = Availability(True, None, None)
+_UNAVAILABLE = Availability(False, None, None)
+
+
 class DiscoveredCliExtension(object):
+    __slots__ = (
+        "__module_full_name",
+        "__full_name",
+        "__package_name",
+        "availability",
+        "__module_name",
+        "__cli_extension",
+    )
+
     def __init__(self, package_name: str, availability: Optional[Availability]) -> None:
-        self.package_name: str = package_name
+        self.__module_full_name: Optional[str] = None
+        self.__full_name: Optional[str] = None
+        self.__package_name: str = package_name
         self.availability = availability
-        self.module_name: Optional[str] = None
-        self.cli_extension: Optional[Type[CliExtension]] = None
+        self.__module_name: Optional[str] = None
+        self.__cli_extension: Optional[Type[CliExtension]] = None
+
+    def __reset_names(self):
+        self.__module_full_name = None
+        self.__full_name = None
+
+    @property
+    def package_name(self) -> str:
+        return self.__package_name
+
+    @package_name.setter
+    def package_name(self, val: str):
+        self.__package_name = val
+        self.__reset_names()
+
+    @property
+    def module_name(self) -> Optional[str]:
+        return self.__module_name
+
+    @module_name.setter
+    def module_name(self, val: Optional[str]):
+        self.__module_name = val
+        self.__reset_names()
+
+    @property
+    def cli_extension(self) -> Optional[Type[CliExtension]]:
+        return self.__cli_extension
+
+    @cli_extension.setter
+    def cli_extension(self, val: Optional[Type[CliExtension]]):
+        self.__cli_extension = val
+        self.__reset_names()
 
     @property
     def is_available(self):
@@ -106,34 +160,37 @@ class DiscoveredCliExtension(object):
 
     @property
     def module_full_name(self) -> Optional[str]:
-        return "{}.{}".format(self.package_name, self.module_name) if self.module_name is not None else None
+        if self.__module_full_name is None and self.__module_name is not None:
+            self.__module_full_name = f"{self.__package_name}.{self.__module_name}"
+        return self.__module_full_name
 
     @property
     def full_name(self) -> Optional[str]:
-        if None in (self.module_full_name, self.cli_extension):
-            if self.package_name is not None:
-                return self.package_name
-            return None
-        return ".".join((self.module_full_name, self.cli_extension.__name__))  # type: ignore
+        if self.__full_name is None:
+            module_full_name = self.module_full_name
+            if module_full_name is None or self.__cli_extension is None:
+                return self.__package_name
+            self.__full_name = f"{module_full_name}.{self.__cli_extension.__name__}"
+        return self.__full_name
 
     def __repr__(self):
         module_name = self.module_full_name
-        return "CliExtension<{}, {}>".format(
-            self.package_name if module_name is None else module_name,
-            self.cli_extension.__name__ if self.cli_extension else "n/a",
-        )
+        if module_name is None:
+            module_name = self.package_name
+        ext_name = self.cli_extension.__name__ if self.cli_extension else "n/a"
+        return f"CliExtension<{module_name}, {ext_name}>"
 
 
 class ExtensionUnavailableError(CLIRackError):
     def __init__(
         self, extension_name: str, reason: Optional[str] = None, hint: Optional[str] = None, *args: object
     ) -> None:
-        super().__init__(*args, fix_hint=hint)
+        super().__init__(reason, *args, fix_hint=hint)
         self.extension_name = extension_name
         self.reason = reason
 
     def __str__(self) -> str:
-        return "{}".format(self.reason)
+        return self.reason if self.reason is not None else ""
 
 
 class ExecutionManagerError(CLIRackError):
@@ -156,9 +213,11 @@ class ExecutionManager(BaseExecutionManager):
         self.__logger = logging.getLogger("cli.exec-mng")
 
     def run(self, commands: Sequence[argparse.Namespace], terminate_on_error=True):
+        # Command name is only mentioned in error message when several commands are executed
+        multiple_commands = len(commands) > 1
         try:
             for cmd in commands:
-                self.__logger.debug("Running {}".format(cmd.cmd))
+                self.__logger.debug("Running %s", cmd.cmd)
                 try:
                     ext = self._instantiate_extension(cmd.ext_cls)
                     self._setup_extension(ext)
@@ -169,8 +228,9 @@ class ExecutionManager(BaseExecutionManager):
                 try:
                     ext.handle(cmd)
                 except Exception as e:
-                    msg = "Error during {} command execution: ".format(cmd.cmd) if len(commands) > 1 else ""
-                    raise ExecutionManagerError(msg + str(e)) from e
+                    if multiple_commands:
+                        raise ExecutionManagerError("Error during {} command execution: {}".format(cmd.cmd, e)) from e
+                    raise ExecutionManagerError(str(e)) from e
         except ExecutionManagerError as e:
             if terminate_on_error:
                 CLI.fail(e)
@@ -184,7 +244,37 @@ class AsyncExecutionManager(BaseExecutionManager):
         self._logger = logging.getLogger("cli.async-exec-mng")
 
 
+class _LazyCommandArgumentParser(argparse.ArgumentParser):
+    """
+    Command parser which is populated by the corresponding extension only when the command is actually used
+    (parsed or help is requested)
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.pending_setup: Optional[Callable[[argparse.ArgumentParser], None]] = None
+
+    def ensure_configured(self):
+        if self.pending_setup is not None:
+            pending_setup, self.pending_setup = self.pending_setup, None
+            pending_setup(self)
+
+    def parse_known_args(self, args=None, namespace=None):
+        self.ensure_configured()
+        return super().parse_known_args(args, namespace)
+
+    def format_usage(self):
+        self.ensure_configured()
+        return super().format_usage()
+
+    def format_help(self):
+        self.ensure_configured()
+        return super().format_help()
+
+
 class CliAppManager:
+    _builtin_global_args_extensions: Optional[Tuple[Type[GlobalArgsExtension], ...]] = None
+
     def __init__(
         self,
         prog_name: str,
@@ -215,6 +305,9 @@ class CliAppManager:
         self.add_discovered_unavailable_report = True
         self.show_unavailable_modules = False
         self.global_args: Optional[argparse.Namespace] = None
+        self.__command_parser: Optional[argparse._SubParsersAction] = None
+        self.__configured_extensions: Set[Type[CliExtension]] = set()
+        self.__is_setup = False
         self.setup_global()
 
     def register_extension(self, *ext_type: Type[CliExtension]) -> None:
@@ -238,24 +331,28 @@ class CliAppManager:
             ext_cls.setup_parser(parser)
 
     @classmethod
-    def __configure_subparser_for_cli_extension(cls, ext_cls: Type[CliExtension], parser: argparse.ArgumentParser):
-        ext_cls.setup_parser(parser)
-        parser.set_defaults(ext_cls=ext_cls)
+    def __get_builtin_global_args_extensions(cls) -> Tuple[Type[GlobalArgsExtension], ...]:
+        if CliAppManager._builtin_global_args_extensions is None:
+            # Imported lazily as cli_extension module depends on this one
+            from .cli_extension import DebugModeCliExtension, VerboseModeCliExtension
+            from .cli_extension import ShowUnavailableModulesCliExtension
+
+            CliAppManager._builtin_global_args_extensions = (
+                DebugModeCliExtension,
+                VerboseModeCliExtension,
+                ShowUnavailableModulesCliExtension,
+            )
+        return CliAppManager._builtin_global_args_extensions
 
     def setup_global(self):
         # Configure global parser
+        debug_ext, verbose_ext, unavailable_report_ext = self.__get_builtin_global_args_extensions()
         if self.add_debug_mode_control:
-            from .cli_extension import DebugModeCliExtension
-
-            self.register_global_args_extension(DebugModeCliExtension)
+            self.register_global_args_extension(debug_ext)
         if self.add_verbosity_control:
-            from .cli_extension import VerboseModeCliExtension
-
-            self.register_global_args_extension(VerboseModeCliExtension)
+            self.register_global_args_extension(verbose_ext)
         if self.add_discovered_unavailable_report:
-            from .cli_extension import ShowUnavailableModulesCliExtension
-
-            self.register_global_args_extension(ShowUnavailableModulesCliExtension)
+            self.register_global_args_extension(unavailable_report_ext)
         self.__setup_parser_for_global_args(self.global_args_parser)
 
     def parse_global(self, args=None) -> argparse.Namespace:
@@ -270,17 +367,31 @@ class CliAppManager:
             instance.handle(parsed)
 
     def setup(self):
-        self.__setup_parser_for_global_args(self.args_parser)
+        """
+        Configures argument parser. Could be called again after registering more extensions, in this case only
+        commands for the newly registered extensions are added.
+        """
+        if not self.__is_setup:
+            self.__setup_parser_for_global_args(self.args_parser)
+            self.__is_setup = True
         if self.add_commands_parser:
-            command_parser = self.args_parser.add_subparsers(
-                title="Available Commands",
-                metavar="command",
-                dest="cmd",
-                description='Use "<command> -h" to get information ' "about particular command",
-            )
+            if self.__command_parser is None:
+                self.__command_parser = self.args_parser.add_subparsers(
+                    title="Available Commands",
+                    metavar="command",
+                    dest="cmd",
+                    description='Use "<command> -h" to get information ' "about particular command",
+                    parser_class=_LazyCommandArgumentParser,
+                )
+            command_parser = self.__command_parser
             for ext_cls in self.available_extensions:
+                if ext_cls in self.__configured_extensions:
+                    continue
+                self.__configured_extensions.add(ext_cls)
                 ext_subparser = command_parser.add_parser(ext_cls.COMMAND_NAME, help=ext_cls.COMMAND_DESCRIPTION)
-                self.__configure_subparser_for_cli_extension(ext_cls, ext_subparser)
+                ext_subparser.set_defaults(ext_cls=ext_cls)
+                # Command arguments are configured on first use, only commands given in command line are set up
+                ext_subparser.pending_setup = ext_cls.setup_parser
             # if self.allow_multiple_commands:
             #     self.args_parser.add_argument(metavar='command', dest='extra', nargs="*", help='One or more commands')
 
@@ -292,16 +403,15 @@ class CliAppManager:
         command_args, unknown = self.args_parser.parse_known_args(args)
         commands = [command_args]
         if self.allow_multiple_commands:
-            prev = unknown.copy()
+            prev_len = len(unknown)
             while unknown:
                 command_args, unknown = self.args_parser.parse_known_args(unknown)
-                # If after second run the unknown args are the same then they must be really unknown
-                # and we don't have any consumer
-                if prev == unknown:
+                # Every successful run consumes at least one argument. If nothing was consumed then remaining args
+                # must be really unknown and we don't have any consumer
+                if len(unknown) >= prev_len:
                     self.__report_unrecognized_args(unknown)
                     break
-                else:
-                    prev = unknown
+                prev_len = len(unknown)
                 commands.append(command_args)
         elif len(unknown) > 0:
             self.__report_unrecognized_args(unknown)
@@ -319,8 +429,9 @@ class CliAppManager:
             if x.is_available:
                 if x.cli_extension is None:
                     self.__logger.warning(
-                        "Ignored extension {}. It is marked as available but class is not assigned. "
-                        "This might be caused by internal data inconsistency due to some bug.".format(x.full_name)
+                        "Ignored extension %s. It is marked as available but class is not assigned. "
+                        "This might be caused by internal data inconsistency due to some bug.",
+                        x.full_name,
                     )
                     continue
                 self.register_extension(x.cli_extension)
@@ -350,24 +461,48 @@ class DiscoveryManager:
     def __init__(self) -> None:
         super().__init__()
         self.__logger = logging.getLogger("cli.discovery")
+        # Probe results keyed by package name. Package object is stored as well so reloaded package is probed again
+        self.__availability_cache: Dict[str, Tuple[object, Availability]] = {}
+        # Discovery results keyed by scan arguments. Value is (scanned dirs, their mtimes, discovered extensions)
+        self.__discovery_cache: Dict[tuple, Tuple[List[str], tuple, List[DiscoveredCliExtension]]] = {}
 
-    def is_package_available(self, pkg_obj: object) -> Availability:
-        if hasattr(pkg_obj, "is_available"):
-            try:
-                if not pkg_obj.is_available():  # type: ignore
-                    return Availability(False, None, None)
-            except ExtensionUnavailableError as e:
-                return Availability(False, str(e), e.fix_hint)
-            except:  # noqa: E722
-                self.__logger.warning(
-                    "CLI discovery probe caught exception during package availability check for {}:\n"
-                    "This might indicate incorrect implementation of the is_available method which "
-                    "should either return boolean or raise ExtensionUnavailableError error",
-                    exc_info=True,
-                )
-                return Availability(False, None, None)
+    def clear_availability_cache(self):
+        self.__availability_cache.clear()
+        # Discovery results depend on availability
+        self.__discovery_cache.clear()
 
-        return Availability(True, None, None)
+    def clear_discovery_cache(self):
+        self.__discovery_cache.clear()
+
+    def is_package_available(self, pkg_obj: object) -> Availability:
+        name = getattr(pkg_obj, "__name__", None)
+        if name is None:
+            return self.__probe_availability(pkg_obj)
+        cached = self.__availability_cache.get(name)
+        if cached is not None and cached[0] is pkg_obj:
+            return cached[1]
+        availability = self.__probe_availability(pkg_obj)
+        self.__availability_cache[name] = (pkg_obj, availability)
+        return availability
+
+    def __probe_availability(self, pkg_obj: object) -> Availability:
+        probe = getattr(pkg_obj, "is_available", None)
+        if probe is None:
+            return _AVAILABLE
+        try:
+            is_available = probe()
+        except ExtensionUnavailableError as e:
+            return Availability(False, str(e), e.fix_hint)
+        except Exception:
+            self.__logger.warning(
+                "CLI discovery probe caught exception during package availability check for %s:\n"
+                "This might indicate incorrect implementation of the is_available method which "
+                "should either return boolean or raise ExtensionUnavailableError error",
+                getattr(pkg_obj, "__name__", pkg_obj),
+                exc_info=True,
+            )
+            return _UNAVAILABLE
+        return _AVAILABLE if is_available else _UNAVAILABLE
 
     def discover_cli_extensions(
         self,
@@ -376,50 +511,103 @@ class DiscoveryManager:
         ignore_unavailable=True,
     ) -> Sequence[DiscoveredCliExtension]:
         """
+        Results are cached until content of any of the scanned package directories changes (directory mtime is
+        checked). Use clear_discovery_cache to force rescan e.g. after installing missing dependencies.
 
         :param package_to_scan: string or string[], full name of the package to scan for extensions
         :param scan_module: string or string[], name of the module within the package to scan for extension classes
         :return:
         """
+        packages_to_scan = (package_to_scan,) if isinstance(package_to_scan, str) else tuple(package_to_scan)
+        modules_to_scan = (scan_module,) if isinstance(scan_module, str) else tuple(scan_module)
+        cache_key = (packages_to_scan, modules_to_scan, bool(ignore_unavailable))
+        cached = self.__discovery_cache.get(cache_key)
+        if cached is not None:
+            scanned_dirs, dirs_stamp, cached_extensions = cached
+            if self.__dirs_stamp(scanned_dirs) == dirs_stamp:
+                self.__logger.debug("Using cached discovery results")
+                return list(cached_extensions)
+        scanned_dirs = []
+        extensions, complete = self.__scan(packages_to_scan, modules_to_scan, ignore_unavailable, scanned_dirs)
+        if complete:
+            self.__discovery_cache[cache_key] = (scanned_dirs, self.__dirs_stamp(scanned_dirs), extensions)
+        if self.__logger.isEnabledFor(logging.DEBUG):
+            self.__logger.debug("Discovered %d extension(-s)", sum(1 for x in extensions if x.is_available))
+        return list(extensions)
+
+    @staticmethod
+    def __dirs_stamp(dirs: Sequence[str]) -> Tuple[Optional[int], ...]:
+        stamp: List[Optional[int]] = []
+        for x in dirs:
+            try:
+                stamp.append(os.stat(x).st_mtime_ns)
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def __scan(
+        self,
+        packages_to_scan: Sequence[str],
+        modules_to_scan: Sequence[str],
+        ignore_unavailable: bool,
+        scanned_dirs: List[str],
+    ) -> Tuple[List[DiscoveredCliExtension], bool]:
+        """
+        :param scanned_dirs: directories of the scanned packages will be appended to this list
+        :return: discovered extensions and flag indicating that all packages to scan were found
+        """
         extensions: List[DiscoveredCliExtension] = []
-        for package_name in scalar_to_list(package_to_scan):  # type: str
+        complete = True
+        for package_name in packages_to_scan:
             try:
-                self.__logger.debug("Scanning package {}".format(package_name))
-                target_package = importlib.import_module(package_name)
-                for loader, pkg_name, is_pkg in pkgutil.walk_packages(target_package.__path__):  # type: ignore
+                self.__logger.debug("Scanning package %s", package_name)
+                target_package = sys.modules.get(package_name) or importlib.import_module(package_name)
+                scanned_dirs.extend(target_package.__path__)  # type: ignore
+                # Only direct subpackages could be extension packages so there is no need to walk deeper
+                for loader, pkg_name, is_pkg in pkgutil.iter_modules(target_package.__path__):  # type: ignore
                     # Check if we've got a valid extension package
                     if is_pkg:
-                        full_name = ".".join((target_package.__name__, pkg_name))
-                        candidate_pkg = importlib.import_module(full_name)
+                        full_name = target_package.__name__ + "." + pkg_name
+                        candidate_pkg = sys.modules.get(full_name) or importlib.import_module(full_name)
+                        scanned_dirs.extend(getattr(candidate_pkg, "__path__", ()))
                         availability = self.is_package_available(candidate_pkg)
                         discovered_extension = DiscoveredCliExtension(full_name, availability)
                         if not availability.is_available:
                             if not ignore_unavailable:
                                 extensions.append(discovered_extension)
                             continue
-                        # Scanning modules
-                        try:
-                            for module_name in scalar_to_list(scan_module):
-                                cli_module = importlib.import_module("." + module_name, full_name)
-                                found_extensions = inspect.getmembers(
-                                    cli_module,
-                                    lambda member: inspect.isclass(member)
-                                    and member != CliExtension
-                                    and issubclass(member, CliExtension),
-                                )
-                                for e_name, e in found_extensions:
-                                    ext = DiscoveredCliExtension(
-                                        discovered_extension.package_name, discovered_extension.availability
-                                    )
-                                    ext.module_name = module_name
-                                    ext.cli_extension = e  # type: ignore
-                                    self.__logger.debug("\tDiscovered CLI extension: {}".format(ext.full_name))
-                                    extensions.append(ext)
-                        except ImportError:
-                            pass
+                        self.__scan_modules(discovered_extension, modules_to_scan, extensions)
             except ImportError:
-                self.__logger.warning("Package {} doesn't exist".format(package_name))
-        self.__logger.debug(
-            "Discovered {} extension(-s)".format(len(list(filter(lambda x: x.is_available, extensions))))
-        )
-        return extensions
+                self.__logger.warning("Package %s doesn't exist", package_name)
+                complete = False
+        return extensions, complete
+
+    def __scan_modules(
+        self,
+        discovered_extension: DiscoveredCliExtension,
+        modules_to_scan: Sequence[str],
+        extensions: List[DiscoveredCliExtension],
+    ):
+        """
+        :param extensions: CLI extensions found in the given modules of the extension package will be appended to this
+            list
+        """
+        try:
+            for module_name in modules_to_scan:
+                cli_module_name = discovered_extension.package_name + "." + module_name
+                cli_module = sys.modules.get(cli_module_name) or importlib.import_module(cli_module_name)
+                # Sorted by name to keep the order inspect.getmembers used to provide
+                found_extensions = sorted(
+                    (n, v)
+                    for n, v in vars(cli_module).items()
+                    if isinstance(v, type) and v is not CliExtension and issubclass(v, CliExtension)
+                )
+                for e_name, e in found_extensions:
+                    ext = DiscoveredCliExtension(discovered_extension.package_name, discovered_extension.availability)
+                    ext.module_name = module_name
+                    ext.cli_extension = e  # type: ignore
+                    if self.__logger.isEnabledFor(logging.DEBUG):
+                        self.__logger.debug("\tDiscovered CLI extension: %s", ext.full_name)
+                    extensions.append(ext)
+        except ImportError:
+            pass
@@ -25,6 +25,17 @@ import datetime
 import json
 
 
+def encode_datetime(obj):
+    """
+    Converts date or datetime into json compatible structure understood by DateTimeDecoder.
+    Could be used as ``default`` hook for json libraries other than stdlib one.
+    IMPORTANT: This implementation replaces timezone with UTC
+    """
+    if isinstance(obj, (datetime.date, datetime.datetime)):
+        return {"__t__": "datetime", "tuple": list(obj.utctimetuple())}
+    raise TypeError("Object of type {} is not JSON serializable".format(obj.__class__.__name__))
+
+
 class DateTimeEncoder(json.JSONEncoder):
     """
     IMPORTANT: This implementation replaces timezone with UTC
@@ -33,7 +44,7 @@ class DateTimeEncoder(json.JSONEncoder):
     # Override the default method
     def default(self, obj):
         if isinstance(obj, (datetime.date, datetime.datetime)):
-            return {"__t__": "datetime", "tuple": obj.utctimetuple()}
+            return encode_datetime(obj)
         else:
             return json.JSONEncoder.default(self, obj)
 
@@ -27,38 +27,42 @@ from typing import Optional
 
 class ExecutionTimer(object):
     def __init__(self, start=True) -> None:
-        self.__start_time: Optional[float] = None
-        self.__end_time: Optional[float] = None
+        self.__start_ns: Optional[int] = None
+        self.__end_ns: Optional[int] = None
         if start:
             self.start()
 
     def start(self):
-        self.__start_time = time.perf_counter()
-        self.__end_time = None
+        self.__start_ns = time.perf_counter_ns()
+        self.__end_ns = None
 
     def stop(self):
-        self.__end_time = time.perf_counter()
+        self.__end_ns = time.perf_counter_ns()
 
     @property
     def is_running(self):
-        return self.__start_time is not None and self.__end_time is None
+        return self.__start_ns is not None and self.__end_ns is None
 
     @property
     def is_finished(self):
-        return self.__start_time is not None and self.__end_time is not None
+        return self.__start_ns is not None and self.__end_ns is not None
 
     @property
-    def elapsed(self) -> Optional[float]:
-        if self.is_finished:
-            return self.__end_time - self.__start_time  # type: ignore
-        if self.is_running:
-            return time.perf_counter() - self.__start_time  # type: ignore
-        else:
+    def elapsed_ns(self) -> Optional[int]:
+        if self.__start_ns is None:
             return None
+        end_ns = self.__end_ns if self.__end_ns is not None else time.perf_counter_ns()
+        return end_ns - self.__start_ns
+
+    @property
+    def elapsed(self) -> Optional[float]:
+        val = self.elapsed_ns
+        return val / 1e9 if val is not None else None
 
     def format_elapsed(self):
-        val = self.elapsed
+        val = self.elapsed_ns
         if val is None:
             return "n/a"
-        else:
-            return "{}s".format(round(val, 2))
+        # Rounded to hundredths of a second using integer math, trailing zeros are dropped (e.g. 1.5s, 2.0s)
+        seconds, hundredths = divmod((val + 5_000_000) // 10_000_000, 100)
+        return "{}.{}s".format(seconds, "{:02d}".format(hundredths).rstrip("0") or "0")
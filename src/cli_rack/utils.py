@@ -25,10 +25,14 @@ import argparse
 import os
 import subprocess
 import sys
-from typing import Sequence, Union, Dict, AbstractSet, TypeVar, Iterable, Optional, Type, Any
+from typing import Sequence, Union, Dict, AbstractSet, TypeVar, Iterable, Optional, Type, Any, Mapping
 
 
 def any_of_keys_exists(keys: Sequence[str], _dict: Union[Dict, Sequence, AbstractSet]) -> bool:
+    if isinstance(_dict, Mapping):
+        return not _dict.keys().isdisjoint(keys)
+    if isinstance(_dict, AbstractSet):
+        return not _dict.isdisjoint(keys)
     for k in keys:
         if k in _dict:
             return True
@@ -53,6 +53,8 @@ class HexInt(int):
 
 
 class IPAddress:
+    __slots__ = ("args",)
+
     def __init__(self, *args):
         if len(args) != 4:
             raise ValueError("IPAddress must consist of 4 items")
@@ -63,6 +65,8 @@ class IPAddress:
 
 
 class MACAddress:
+    __slots__ = ("parts",)
+
     def __init__(self, *parts):
         if len(parts) != 6:
             raise ValueError("MAC Address must consist of 6 items")
@@ -77,7 +81,20 @@ class MACAddress:
         return f"0x{num}ULL"
 
 
+# Time units from the largest to the smallest along with the number of units in the previous one
+_TIME_UNITS = (
+    ("days", 1),
+    ("hours", 24),
+    ("minutes", 60),
+    ("seconds", 60),
+    ("milliseconds", 1000),
+    ("microseconds", 1000),
+)
+
+
 class TimePeriod:
+    __slots__ = ("days", "hours", "minutes", "seconds", "milliseconds", "microseconds")
+
     def __init__(
             self,
             microseconds=None,
@@ -168,29 +185,38 @@ class TimePeriod:
     def __repr__(self):
         return f"TimePeriod<{self.total_microseconds}>"
 
+    def _fold(self, levels: int) -> int:
+        """
+        Converts the first ``levels`` units (starting from days) into the total number of the smallest of them
+        """
+        total = 0
+        for unit, factor in _TIME_UNITS[:levels]:
+            total = total * factor + (getattr(self, unit) or 0)
+        return total
+
     @property
     def total_microseconds(self):
-        return self.total_milliseconds * 1000 + (self.microseconds or 0)
+        return self._fold(6)
 
     @property
     def total_milliseconds(self):
-        return self.total_seconds * 1000 + (self.milliseconds or 0)
+        return self._fold(5)
 
     @property
     def total_seconds(self):
-        return self.total_minutes * 60 + (self.seconds or 0)
+        return self._fold(4)
 
     @property
     def total_minutes(self):
-        return self.total_hours * 60 + (self.minutes or 0)
+        return self._fold(3)
 
     @property
     def total_hours(self):
-        return self.total_days * 24 + (self.hours or 0)
+        return self._fold(2)
 
     @property
     def total_days(self):
-        return self.days or 0
+        return self._fold(1)
 
     def __eq__(self, other):
         if isinstance(other, TimePeriod):
@@ -224,22 +250,24 @@ class TimePeriod:
 
 
 class TimePeriodMicroseconds(TimePeriod):
-    pass
+    __slots__ = ()
 
 
 class TimePeriodMilliseconds(TimePeriod):
-    pass
+    __slots__ = ()
 
 
 class TimePeriodSeconds(TimePeriod):
-    pass
+    __slots__ = ()
 
 
 class TimePeriodMinutes(TimePeriod):
-    pass
+    __slots__ = ()
 
 
 class ValidationResult:
+    __slots__ = ("error", "normalized_data", "data")
+
     def __init__(self, data: Any) -> None:
         self.error: Optional[MultipleInvalid] = None
         self.normalized_data: Any = data
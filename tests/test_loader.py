@@ -0,0 +1,29 @@
+import os
+import tempfile
+import unittest
+
+from cli_rack.exception import CLIRackError
+from cli_rack.loader import LocalLoader
+
+
+class LocalLoaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.loader = LocalLoader(os.path.join(self.tmp_dir.name, "external"))
+
+    def tearDown(self) -> None:
+        self.tmp_dir.cleanup()
+
+    def test_source_created_after_failed_load(self):
+        source = os.path.join(self.tmp_dir.name, "source")
+        with self.assertRaises(CLIRackError):
+            self.loader.load("local:" + source)
+        os.mkdir(source)
+        with open(os.path.join(source, "file.txt"), "w") as f:
+            f.write("content")
+        meta = self.loader.load("local:" + source)
+        self.assertTrue(os.path.isfile(os.path.join(meta.resolved_path, "file.txt")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+
+import voluptuous as vol
+
+from cli_rack_validation import crv
+from cli_rack_validation.domain import HexInt
+
+
+class EnumTest(unittest.TestCase):
+    def test_enum_tags_hex_int(self):
+        value = vol.All(crv.hex_int, crv.enum({1: "one"}))("0x1")
+        self.assertIsInstance(value, HexInt)
+        self.assertEqual(value, 1)
+        self.assertEqual(value.enum_value, "one")
+
+
+if __name__ == "__main__":
+    unittest.main()